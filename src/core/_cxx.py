@@ -1,10 +1,23 @@
 #  src/core/_cxx.py  ----------------------------------------------------------
+"""
+Fast-path dispatch: C++ backend when built, pure Python otherwise.
+
+Importing this module only pulls in NumPy (plus the extension if present).
+pandas and the Python ``tournament`` fallback are loaded on first use, so
+worker processes and short CLI runs do not pay for them up front.
+"""
 
 from __future__ import annotations
-import importlib, pandas as pd, numpy as np
-from .tournament import simulate_many  # python fallback
+import importlib
+from typing import TYPE_CHECKING, Dict, Sequence
+
+import numpy as np
+
 from .match_model import match_probabilities
 
+if TYPE_CHECKING:                       # annotations only – no runtime import
+    import pandas as pd
+
 try:
     _cxx   = importlib.import_module("cxx_sim")
     HAS_CXX = True
@@ -19,18 +32,50 @@ def win_prob_fast(s_a: float, s_b: float) -> float:
     return match_probabilities(s_a, s_b)["home"]
 
 
-def simulate_many_fast(strength_df: pd.DataFrame,
+def simulate_many_arrays(teams: Sequence[str],
+                         strengths: Sequence[float],
+                         n_runs: int = 20_000,
+                         seed: int | None = None,
+                         P: np.ndarray | None = None) -> Dict[str, float]:
+    """
+    DataFrame-free Monte-Carlo: ``{team: champion_prob}``.
+
+    ``P`` is an optional precomputed win matrix handed to the active backend
+    (see :pyfunc:`src.core.match_model.win_matrix`): ``draw_share=0.5`` for
+    the C++ knock-outs, ``draw_share=0`` for the Python tournament.
+    """
+    if HAS_CXX:
+        kw = {} if P is None else {"win_matrix": np.asarray(P, dtype=float).tolist()}
+        return _cxx.simulate_many(list(teams),
+                                  np.asarray(strengths, dtype=float).tolist(),
+                                  n_runs=n_runs,
+                                  seed=0 if seed is None else seed,
+                                  **kw)
+    import pandas as pd
+    from .tournament import simulate_many
+    strength_df = pd.DataFrame({"team": list(teams),
+                                "strength": np.asarray(strengths, dtype=float)})
+    probs = simulate_many(strength_df, n_runs=n_runs, seed=seed, P=P)
+    return dict(zip(probs["team"], probs["champion_prob"]))
+
+
+def probs_to_frame(probs: Dict[str, float]) -> "pd.DataFrame":
+    """``{team: prob}`` → the ``team, champion_prob`` frame the UI expects."""
+    import pandas as pd
+    return (pd.Series(probs, name="champion_prob")
+            .rename_axis("team")
+            .reset_index()
+            .sort_values("champion_prob", ascending=False))
+
+
+def simulate_many_fast(strength_df: "pd.DataFrame",
                        n_runs: int = 20_000,
-                       seed: int | None = None) -> pd.DataFrame:
+                       seed: int | None = None) -> "pd.DataFrame":
     """Run the tournament Monte-Carlo using the C++ backend when available."""
     if HAS_CXX:
-        teams      = strength_df["team"].tolist()
-        strengths  = strength_df["strength"].to_numpy(dtype=float).tolist()
-        probs_dict = _cxx.simulate_many(teams, strengths,
-                                        n_runs=n_runs,
-                                        seed=0 if seed is None else seed)
-        return (pd.Series(probs_dict, name="champion_prob")
-                .rename_axis("team")
-                .reset_index()
-                .sort_values("champion_prob", ascending=False))
+        probs = simulate_many_arrays(strength_df["team"].tolist(),
+                                     strength_df["strength"].to_numpy(dtype=float),
+                                     n_runs=n_runs, seed=seed)
+        return probs_to_frame(probs)
+    from .tournament import simulate_many
     return simulate_many(strength_df, n_runs=n_runs, seed=seed)
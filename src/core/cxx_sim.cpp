@@ -12,6 +12,7 @@
 #include <algorithm>
 #include <numeric>
 #include <unordered_map>
+#include <stdexcept>
 
 namespace py = pybind11;
 
@@ -74,14 +75,18 @@ void play_group(const std::vector<double>& s,
     third = st[2];                                // candidate for “best 3rd”
 }
 // ---------- knock-out bracket (32 teams) ------------------------------------
+// P: optional row-major N×N matrix of P(row beats col); nullptr → win_prob()
 int play_knock(const std::vector<double>& s,
                std::vector<int> teams,
-               std::mt19937& rng)
+               std::mt19937& rng,
+               const std::vector<double>* P = nullptr)
 {
+    const size_t N = s.size();
     while(teams.size()>1){
         std::vector<int> nxt;
         for(size_t i=0;i<teams.size();i+=2){
-            double pA = win_prob(s[teams[i]], s[teams[i+1]]);
+            double pA = P ? (*P)[teams[i]*N + teams[i+1]]
+                          : win_prob(s[teams[i]], s[teams[i+1]]);
             nxt.push_back( std::generate_canonical<double,10>(rng)<pA ? teams[i]
                                                                      : teams[i+1] );
         }
@@ -91,7 +96,8 @@ int play_knock(const std::vector<double>& s,
 }
 // ---------- main simulator ---------------------------------------------------
 std::string simulate_tournament_once(const std::vector<double>& s,
-                                     std::mt19937& rng)
+                                     std::mt19937& rng,
+                                     const std::vector<double>* P = nullptr)
 {
     // assume len(teams)==48  (pass in exactly 48 lambdas/teams)
     std::array<int,48> id{};
@@ -112,18 +118,19 @@ std::string simulate_tournament_once(const std::vector<double>& s,
     for(int k=0;k<8;++k) ko32.push_back(thirds[k].id);
 
     // ---- fixed bracket (simple seed: ko32 order)
-    return std::to_string( play_knock(s, ko32, rng) ); // returns id as string
+    return std::to_string( play_knock(s, ko32, rng, P) ); // returns id as string
 }
 // ---------- bulk Monte-Carlo wrapper ----------------------------------------
-py::dict simulate_many(const std::vector<std::string>& teams,
-                       const std::vector<double>&    strengths,
-                       int                           n_runs = 20000,
-                       unsigned                      seed   = 0)
+py::dict simulate_many_impl(const std::vector<std::string>& teams,
+                            const std::vector<double>&    strengths,
+                            const std::vector<double>*    P,
+                            int                           n_runs,
+                            unsigned                      seed)
 {
     std::vector<int> wins(teams.size());
     std::mt19937 rng(seed);
     for(int r=0;r<n_runs;++r){
-        int champ = std::stoi( simulate_tournament_once(strengths, rng) );
+        int champ = std::stoi( simulate_tournament_once(strengths, rng, P) );
         ++wins[champ];
     }
     py::dict d;
@@ -131,6 +138,30 @@ py::dict simulate_many(const std::vector<std::string>& teams,
         d[py::str(teams[i])] = double(wins[i])/n_runs;
     return d;
 }
+py::dict simulate_many(const std::vector<std::string>& teams,
+                       const std::vector<double>&    strengths,
+                       int                           n_runs = 20000,
+                       unsigned                      seed   = 0)
+{
+    return simulate_many_impl(teams, strengths, nullptr, n_runs, seed);
+}
+// same, but knock-out odds come from a precomputed N×N win matrix
+py::dict simulate_many_matrix(const std::vector<std::string>&        teams,
+                              const std::vector<double>&             strengths,
+                              const std::vector<std::vector<double>>& win_matrix,
+                              int                                    n_runs = 20000,
+                              unsigned                               seed   = 0)
+{
+    const size_t N = strengths.size();
+    if(win_matrix.size()!=N)
+        throw std::invalid_argument("win_matrix must be N×N");
+    std::vector<double> P; P.reserve(N*N);
+    for(const auto& row : win_matrix){
+        if(row.size()!=N) throw std::invalid_argument("win_matrix must be N×N");
+        P.insert(P.end(), row.begin(), row.end());
+    }
+    return simulate_many_impl(teams, strengths, &P, n_runs, seed);
+}
 // ----------------------------------------------------------------------------
 /* … existing code … */
 
@@ -145,5 +176,10 @@ PYBIND11_MODULE(cxx_sim, m) {
     m.def("simulate_many", &simulate_many,
           py::arg("teams"), py::arg("strengths"),
           py::arg("n_runs") = 20'000, py::arg("seed") = 0U);
+
+    // overload: reuse a precomputed P(row beats col) matrix in the knock-outs
+    m.def("simulate_many", &simulate_many_matrix,
+          py::arg("teams"), py::arg("strengths"), py::arg("win_matrix"),
+          py::arg("n_runs") = 20'000, py::arg("seed") = 0U);
 }
 
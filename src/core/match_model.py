@@ -3,11 +3,12 @@ Single-match Poisson model using team strengths.
 λ_home = exp(μ + s_home − s_away)
 λ_away = exp(μ + s_away − s_home)
 We pick μ so the expected goals per team ≈ 1.35 (world-cup average).
+
+NumPy only – no scipy/pandas – so the numeric core stays cheap to import.
 """
 
 from __future__ import annotations
 import numpy as np
-from scipy.stats import poisson
 
 
 MU = np.log(1.35)  # baseline log-rate
@@ -19,17 +20,28 @@ def expected_goals(s_home: float, s_away: float) -> tuple[float, float]:
     return lam_home, lam_away
 
 
+def poisson_pmf_table(lam: np.ndarray, max_goals: int = 8) -> np.ndarray:
+    """(F, max_goals+1) table of P(k goals) for every rate in ``lam``."""
+    lam = np.atleast_1d(np.asarray(lam, dtype=np.float64))[:, None]
+    k = np.arange(max_goals + 1)
+    log_fact = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, max_goals + 1)))))
+    return np.exp(k * np.log(lam) - lam - log_fact)
+
+
 def match_probabilities(s_home: float, s_away: float, max_goals: int = 8) -> dict:
     """
     Returns dict {home_win, draw, away_win} using independent Poissons truncated at max_goals.
     """
     lam_h, lam_a = expected_goals(s_home, s_away)
 
+    pmf_h = poisson_pmf_table(lam_h, max_goals)[0]
+    pmf_a = poisson_pmf_table(lam_a, max_goals)[0]
+
     probs = {"home": 0.0, "draw": 0.0, "away": 0.0}
     for i in range(max_goals + 1):
-        p_i = poisson.pmf(i, lam_h)
+        p_i = pmf_h[i]
         for j in range(max_goals + 1):
-            p_j = poisson.pmf(j, lam_a)
+            p_j = pmf_a[j]
             if i > j:
                 probs["home"] += p_i * p_j
             elif i == j:
@@ -41,3 +53,24 @@ def match_probabilities(s_home: float, s_away: float, max_goals: int = 8) -> dic
     for k in probs:
         probs[k] /= total
     return probs
+
+
+def win_matrix(strengths: np.ndarray, max_goals: int = 8,
+               draw_share: float = 0.0) -> np.ndarray:
+    """
+    N×N matrix of P(row team beats column team) in one vectorised pass.
+    ``draw_share=0`` gives ``match_probabilities(s_i, s_j)["home"]`` (what
+    the Python tournament uses); ``draw_share=0.5`` gives the knock-out odds
+    of the C++ core (penalties 50-50).  Diagonal 0.5.
+    """
+    s = np.asarray(strengths, dtype=np.float64)
+    n = len(s)
+    lam_h, lam_a = expected_goals(s[:, None], s[None, :])
+    p_h = poisson_pmf_table(lam_h.ravel(), max_goals)
+    p_a = poisson_pmf_table(lam_a.ravel(), max_goals)
+    grid = p_h[:, :, None] * p_a[:, None, :]
+    i, j = np.indices(grid.shape[1:])
+    P = ((grid[:, i > j].sum(axis=1) + draw_share * grid[:, i == j].sum(axis=1))
+         / grid.sum(axis=(1, 2))).reshape(n, n)
+    np.fill_diagonal(P, 0.5)
+    return P
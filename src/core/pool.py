@@ -0,0 +1,89 @@
+#  src/core/pool.py  ----------------------------------------------------------
+"""
+Pre-warmed simulation workers.
+
+Each worker imports the numeric core, loads the C++ extension and builds the
+knock-out win matrix (``win_matrix(..., draw_share=0.5)``) exactly once in its
+initializer; every request then hands that matrix to ``cxx_sim`` and only
+pays for the Monte-Carlo itself.  The pool needs the C++ backend – the
+Python tournament fallback is not served here.
+
+    with SimulationPool(teams, strengths, processes=4) as pool:
+        probs = pool.simulate(100_000, seed=42)     # {team: champion_prob}
+"""
+
+from __future__ import annotations
+import multiprocessing as mp
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# per-process state, filled by _warm_up()
+_TEAMS:     List[str]   = []
+_STRENGTHS: np.ndarray  = np.empty(0)
+_P:         np.ndarray | None = None
+
+
+def _warm_up(teams: Sequence[str], strengths: Sequence[float]) -> None:
+    """Worker initializer: import core, load backend, cache the win matrix."""
+    global _TEAMS, _STRENGTHS, _P
+    from . import _cxx                              # loads cxx_sim
+    from .match_model import win_matrix
+    _TEAMS     = list(teams)
+    _STRENGTHS = np.asarray(strengths, dtype=float)
+    _P         = win_matrix(_STRENGTHS, draw_share=0.5)   # penalties 50-50
+
+
+def _run(job: Tuple[int, int]) -> Dict[str, float]:
+    from ._cxx import simulate_many_arrays
+    n_runs, seed = job
+    return simulate_many_arrays(_TEAMS, _STRENGTHS, n_runs=n_runs, seed=seed, P=_P)
+
+
+class SimulationPool:
+    """Process pool whose workers stay warm across simulation requests."""
+
+    def __init__(self,
+                 teams: Sequence[str],
+                 strengths: Sequence[float],
+                 processes: int | None = None) -> None:
+        from . import _cxx
+        if not _cxx.HAS_CXX:
+            raise RuntimeError("SimulationPool needs the C++ backend (cxx_sim) – build it first")
+        self.teams     = list(teams)
+        self.processes = processes or mp.cpu_count()
+        self._pool     = mp.Pool(self.processes,
+                                 initializer=_warm_up,
+                                 initargs=(self.teams, list(map(float, strengths))))
+
+    # ───────────────────────────────────────────── requests
+    def simulate(self, n_runs: int = 20_000, seed: int | None = None) -> Dict[str, float]:
+        """Shard ``n_runs`` across the workers and merge: ``{team: prob}``."""
+        if n_runs <= 0:
+            raise ValueError(f"n_runs must be positive, got {n_runs}")
+        n_shards = max(1, min(self.processes, n_runs))
+        sizes    = [n_runs // n_shards + (k < n_runs % n_shards) for k in range(n_shards)]
+        seeds    = np.random.SeedSequence(seed).generate_state(n_shards).tolist()
+        results  = self._pool.map(_run, list(zip(sizes, seeds)))
+
+        probs = dict.fromkeys(self.teams, 0.0)
+        for size, res in zip(sizes, results):
+            for team, p in res.items():
+                probs[team] += p * size / n_runs
+        return probs
+
+    def simulate_df(self, n_runs: int = 20_000, seed: int | None = None):
+        """:meth:`simulate` as the ``team, champion_prob`` DataFrame."""
+        from ._cxx import probs_to_frame
+        return probs_to_frame(self.simulate(n_runs, seed))
+
+    # ───────────────────────────────────────────── lifecycle
+    def close(self) -> None:
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self) -> "SimulationPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,202 @@
+#  src/core/pricing.py  -------------------------------------------------------
+"""
+Bulk fixture pricer built on the single-match Poisson model.
+
+All fixtures are priced in one shot: the Poisson pmfs for every home/away
+rate are evaluated as a (F, G+1) array and the scoreline grids are formed
+by an outer product, giving an (F, G+1, G+1) tensor.  Every market is then
+a masked sum over that tensor:
+
+* 1X2            – lower / diagonal / upper triangle
+* over / under   – cells with i + j strictly above / below the line
+                   (on whole-number lines the push mass is in neither)
+* BTTS           – cells with i ≥ 1 and j ≥ 1
+* correct score  – the grid itself
+
+Grids are truncated at ``max_goals`` and renormalised, exactly like
+:pyfunc:`src.core.match_model.match_probabilities`, so the 1X2 columns agree
+with the per-pair function to floating-point precision.
+"""
+
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+from typing import Iterable, Sequence, Tuple
+
+from .match_model import expected_goals, poisson_pmf_table
+from .vig import strip_vig_h2h_df
+
+
+# ---------------------------------------------------------------------------
+def score_grids(s_home: np.ndarray, s_away: np.ndarray, max_goals: int = 8) -> np.ndarray:
+    """
+    Correct-score grids for many fixtures at once.
+
+    Returns an (F, G+1, G+1) array where ``out[f, i, j]`` is the probability
+    that fixture ``f`` ends ``i``–``j`` (home goals first).  Each grid sums
+    to 1.
+    """
+    lam_h, lam_a = expected_goals(np.asarray(s_home, dtype=np.float64),
+                                  np.asarray(s_away, dtype=np.float64))
+    p_h = poisson_pmf_table(lam_h, max_goals)
+    p_a = poisson_pmf_table(lam_a, max_goals)
+    grid = p_h[:, :, None] * p_a[:, None, :]
+    return grid / grid.sum(axis=(1, 2), keepdims=True)
+
+
+# ---------------------------------------------------------------------------
+def _fixture_index(strength_df: pd.DataFrame,
+                   fixtures: Iterable[Tuple[str, str]] | None
+                   ) -> Tuple[np.ndarray, np.ndarray, list[str]]:
+    """Resolve fixtures to (home_idx, away_idx, teams); ``None`` → all pairs."""
+    teams = strength_df["team"].tolist()
+    if fixtures is None:
+        n = len(teams)
+        home, away = np.nonzero(~np.eye(n, dtype=bool))
+        return home, away, teams
+
+    idx = {t: i for i, t in enumerate(teams)}
+    fixtures = list(fixtures)
+    unknown = sorted({t for f in fixtures for t in f if t not in idx})
+    if unknown:
+        raise KeyError(f"teams missing from strength_df: {unknown}")
+    home = np.fromiter((idx[h] for h, _ in fixtures), dtype=np.intp, count=len(fixtures))
+    away = np.fromiter((idx[a] for _, a in fixtures), dtype=np.intp, count=len(fixtures))
+    return home, away, teams
+
+
+def _grids_for(strength_df: pd.DataFrame,
+               fixtures: Iterable[Tuple[str, str]] | None,
+               max_goals: int) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Fixture names + strengths frame and the matching score grids."""
+    home, away, teams = _fixture_index(strength_df, fixtures)
+    strength = strength_df["strength"].to_numpy(dtype=np.float64)
+    names = np.asarray(teams, dtype=object)
+    frame = pd.DataFrame({
+        "home_team": names[home],
+        "away_team": names[away],
+        "s_home":    strength[home],
+        "s_away":    strength[away],
+    })
+    grid = score_grids(frame["s_home"].to_numpy(), frame["s_away"].to_numpy(), max_goals)
+    return frame, grid
+
+
+# ---------------------------------------------------------------------------
+def price_fixtures(strength_df: pd.DataFrame,
+                   fixtures: Iterable[Tuple[str, str]] | None = None,
+                   max_goals: int = 8,
+                   lines: Sequence[float] = (2.5,)) -> pd.DataFrame:
+    """
+    Fair prices for 1X2, over/under and both-teams-to-score markets.
+
+    Parameters
+    ----------
+    strength_df :
+        Output of :pyfunc:`src.core.strength.calc_team_strength`.
+    fixtures :
+        ``(home_team, away_team)`` pairs.  ``None`` prices every ordered
+        pair of teams in ``strength_df`` (48 × 47 for the full field).
+    max_goals :
+        Per-team truncation of the scoreline grid.
+    lines :
+        Goal-total lines; each adds ``over_<line>`` / ``under_<line>``.
+        For whole-number lines a total exactly on the line is a push, so
+        ``over + under < 1``.
+    Returns
+    -------
+    DataFrame with columns
+        home_team, away_team, lambda_home, lambda_away, home, draw, away,
+        over_*/under_* per line, btts_yes, btts_no
+    """
+    out, grid = _grids_for(strength_df, fixtures, max_goals)
+    lam_h, lam_a = expected_goals(out.pop("s_home").to_numpy(),
+                                  out.pop("s_away").to_numpy())
+    out["lambda_home"] = lam_h
+    out["lambda_away"] = lam_a
+
+    i, j = np.indices(grid.shape[1:])
+    out["home"] = grid[:, i > j].sum(axis=1)
+    out["draw"] = grid[:, i == j].sum(axis=1)
+    out["away"] = grid[:, i < j].sum(axis=1)
+
+    for line in lines:
+        out[f"over_{line:g}"] = grid[:, (i + j) > line].sum(axis=1)
+        out[f"under_{line:g}"] = grid[:, (i + j) < line].sum(axis=1)
+
+    out["btts_yes"] = grid[:, 1:, 1:].sum(axis=(1, 2))
+    out["btts_no"] = 1.0 - out["btts_yes"]
+    return out
+
+
+def correct_score_table(strength_df: pd.DataFrame,
+                        fixtures: Iterable[Tuple[str, str]] | None = None,
+                        max_goals: int = 8) -> pd.DataFrame:
+    """Long table: home_team, away_team, home_goals, away_goals, prob."""
+    names, grid = _grids_for(strength_df, fixtures, max_goals)
+    n_fix, n_g = grid.shape[0], grid.shape[1]
+    i, j = np.indices((n_g, n_g))
+    return pd.DataFrame({
+        "home_team":  np.repeat(names["home_team"].to_numpy(), n_g * n_g),
+        "away_team":  np.repeat(names["away_team"].to_numpy(), n_g * n_g),
+        "home_goals": np.tile(i.ravel(), n_fix),
+        "away_goals": np.tile(j.ravel(), n_fix),
+        "prob":       grid.reshape(n_fix, -1).ravel(),
+    })
+
+
+# ---------------------------------------------------------------------------
+_OUTCOMES = ("home", "draw", "away")
+
+
+def edge_table(strength_df: pd.DataFrame,
+               h2h_df: pd.DataFrame,
+               max_goals: int = 8) -> pd.DataFrame:
+    """
+    Join model 1X2 prices against de-vigged bookmaker H2H prices.
+
+    ``h2h_df`` is the tidy frame from ``OddsAPIClient(markets="h2h")``
+    (``*_prob`` columns are added if missing).  Fixtures whose teams are not
+    in ``strength_df`` are dropped.  Returns one row per match × bookmaker ×
+    outcome with ``edge = model_prob × decimal_odds − 1``, best edge first.
+
+    Two-way books (no ``draw_odds``) de-vig over home/away only, so for those
+    rows the model's home/away are renormalised without the draw to keep
+    both sides on the same two-outcome basis.  An empty refresh gives an
+    empty edge table; a frame without ``draw_odds`` is treated as two-way.
+    """
+    if h2h_df.empty:
+        return pd.DataFrame(columns=["match_id", "bookmaker", "home_team", "away_team",
+                                     "outcome", "model_prob", "market_prob",
+                                     "decimal_odds", "edge"])
+    if "draw_odds" not in h2h_df.columns:
+        h2h_df = h2h_df.assign(draw_odds=np.nan)
+    if not {f"{o}_prob" for o in _OUTCOMES} <= set(h2h_df.columns):
+        h2h_df = strip_vig_h2h_df(h2h_df)
+
+    known = set(strength_df["team"])
+    books = h2h_df[h2h_df["home_team"].isin(known) & h2h_df["away_team"].isin(known)]
+    fixtures = books[["home_team", "away_team"]].drop_duplicates()
+    model = price_fixtures(strength_df,
+                           fixtures.itertuples(index=False, name=None),
+                           max_goals=max_goals)
+    merged = books.merge(model[["home_team", "away_team", *_OUTCOMES]],
+                         on=["home_team", "away_team"])
+    two_way = merged["draw_odds"].isna()
+    no_draw = merged.loc[two_way, "home"] + merged.loc[two_way, "away"]
+    merged.loc[two_way, "home"] /= no_draw
+    merged.loc[two_way, "away"] /= no_draw
+
+    id_cols = [c for c in ("match_id", "commence_time", "bookmaker",
+                           "home_team", "away_team") if c in merged.columns]
+    frames = []
+    for o in _OUTCOMES:
+        tmp = merged[id_cols].copy()
+        tmp["outcome"] = o
+        tmp["model_prob"] = merged[o].to_numpy()
+        tmp["market_prob"] = merged[f"{o}_prob"].to_numpy()
+        tmp["decimal_odds"] = merged[f"{o}_odds"].to_numpy()
+        frames.append(tmp)
+    out = pd.concat(frames, ignore_index=True).dropna(subset=["decimal_odds"])
+    out["edge"] = out["model_prob"] * out["decimal_odds"] - 1.0
+    return out.sort_values("edge", ascending=False).reset_index(drop=True)
@@ -18,21 +18,12 @@ from typing import Dict, List, Tuple
 
 from .group_draw   import make_pots, draw_groups
 from .group_stage  import play_group
-from .match_model  import match_probabilities
+from .match_model  import win_matrix
 
 # ---------------------------------------------------------------------------
 def _win_matrix(strength_df: pd.DataFrame) -> np.ndarray:
-    """N×N matrix of P(A beats B).  Heavy to compute → cache per run."""
-    strength = strength_df["strength"].to_numpy()
-    N   = len(strength)
-    P   = np.empty((N, N), dtype=np.float64)
-    for i in range(N):
-        for j in range(N):
-            if i == j:
-                P[i, j] = 0.5                       # never used
-            else:
-                P[i, j] = match_probabilities(strength[i], strength[j])["home"]
-    return P
+    """N×N matrix of P(A beats B).  Cache per run (or per worker)."""
+    return win_matrix(strength_df["strength"].to_numpy())
 
 # Hard‑coded round‑of‑32 slot order (winner of group A, 2nd of group C, …)
 BRACKET_ORDER = [
@@ -86,12 +77,14 @@ def _simulate_knockout(teams: List[str], P: np.ndarray,
 # ---------------------------------------------------------------------------
 def simulate_many(strength_df: pd.DataFrame,
                   n_runs: int = 20_000,
-                  seed:   int | None = None) -> pd.DataFrame:
-    """Full Monte‑Carlo with groups + KO."""
+                  seed:   int | None = None,
+                  P:      np.ndarray | None = None) -> pd.DataFrame:
+    """Full Monte‑Carlo with groups + KO.  Pass ``P`` to reuse a win matrix."""
     rng = np.random.default_rng(seed)
     teams = strength_df["team"].tolist()
     idx   = {t: i for i, t in enumerate(teams)}
-    P     = _win_matrix(strength_df)
+    if P is None:
+        P = _win_matrix(strength_df)
 
     win_count = dict.fromkeys(teams, 0)
 
@@ -24,6 +24,19 @@ def strip_vig_h2h(row: pd.Series) -> pd.Series:
     return row
 
 
+def strip_vig_h2h_df(df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorised :func:`strip_vig_h2h` over a whole H2H frame."""
+    cols = ["home_odds", "away_odds", "draw_odds"]
+    if df.empty:                          # no events listed → nothing to strip
+        return df.copy()
+    probs = 1.0 / df.reindex(columns=cols).astype(float)
+    adj = probs.div(probs.sum(axis=1), axis=0)
+    out = df.copy()
+    for c in cols:
+        out[c.replace("_odds", "_prob")] = adj[c]
+    return out
+
+
 def strip_vig_outrights(df: pd.DataFrame) -> pd.DataFrame:
     """Normalise outright odds per bookmaker so probabilities sum to 1."""
     out = []
@@ -14,7 +14,7 @@ import typer
 from dotenv import load_dotenv
 
 from src.data.odds_api import OddsAPIClient
-from src.core.vig import strip_vig_h2h, strip_vig_outrights
+from src.core.vig import strip_vig_h2h_df, strip_vig_outrights
 
 app = typer.Typer()
 load_dotenv()
@@ -32,7 +32,7 @@ def main(
     df = client.to_dataframe(raw)
 
     if markets == "h2h":
-        df = df.apply(strip_vig_h2h, axis=1)
+        df = strip_vig_h2h_df(df)
     elif markets == "outrights":
         df = strip_vig_outrights(df)
 
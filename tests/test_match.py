@@ -1,4 +1,4 @@
-from src.core.match_model import match_probabilities, expected_goals
+from src.core.match_model import match_probabilities, expected_goals, win_matrix
 
 
 def test_probs_sum_to_one():
@@ -9,3 +9,23 @@ def test_probs_sum_to_one():
 def test_expected_goals_sensible():
     lam_h, lam_a = expected_goals(0.0, 0.0)
     assert 0.5 < lam_h < 3.0 and 0.5 < lam_a < 3.0
+
+
+def test_win_matrix_matches_single_match_model():
+    s = [0.2, -0.1, 0.05, -0.3, 0.1, 0.0]
+    P = win_matrix(s)
+    for i in range(6):
+        for j in range(6):
+            if i != j:
+                assert abs(P[i, j] - match_probabilities(s[i], s[j])["home"]) < 1e-12
+
+
+def test_win_matrix_knockout_draw_share():
+    s = [0.2, -0.1, 0.05]
+    P = win_matrix(s, draw_share=0.5)
+    for i in range(3):
+        for j in range(3):
+            if i != j:
+                probs = match_probabilities(s[i], s[j])
+                assert abs(P[i, j] - (probs["home"] + 0.5 * probs["draw"])) < 1e-12
+                assert abs(P[i, j] + P[j, i] - 1.0) < 1e-12
@@ -0,0 +1,68 @@
+import importlib.util, os, sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.core._cxx as cxx
+from src.core._cxx import HAS_CXX
+from src.core.pool import SimulationPool
+from src.core.strength import calc_team_strength
+
+teams       = [f"T{i:02d}" for i in range(48)]
+strength_df = calc_team_strength(
+    pd.DataFrame({"team": teams, "implied_prob": np.linspace(0.002, 0.1, 48)})
+)
+
+# stand-in for the compiled extension: teams[0] wins shards of ≥2 runs, teams[1] the rest
+STUB = '''
+def simulate_many(teams, strengths, n_runs=20000, seed=0, win_matrix=None):
+    n = len(teams)
+    if win_matrix is None or len(win_matrix) != n or any(len(r) != n for r in win_matrix):
+        raise ValueError("pool must pass its precomputed N x N win matrix")
+    probs = dict.fromkeys(teams, 0.0)
+    probs[teams[0] if n_runs >= 2 else teams[1]] = 1.0
+    return probs
+'''
+
+
+@pytest.fixture
+def stub_backend(tmp_path, monkeypatch):
+    path = tmp_path / "cxx_sim.py"
+    path.write_text(STUB)
+    # spawn/forkserver workers re-import cxx_sim; stub must shadow a real build
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join([str(tmp_path), os.environ.get("PYTHONPATH", "")]))
+    spec = importlib.util.spec_from_file_location("cxx_sim", path)
+    cxx_sim = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(cxx_sim)
+    monkeypatch.setitem(sys.modules, "cxx_sim", cxx_sim)
+    monkeypatch.setattr(cxx, "_cxx", cxx_sim, raising=False)
+    monkeypatch.setattr(cxx, "HAS_CXX", True)
+
+
+def test_pool_shards_and_merges(stub_backend):
+    with SimulationPool(strength_df["team"], strength_df["strength"], processes=2) as pool:
+        probs = pool.simulate(n_runs=3, seed=1)          # shards of 2 + 1 runs
+        with pytest.raises(ValueError):
+            pool.simulate(n_runs=0)
+    first, second = strength_df["team"].iloc[:2]
+    assert abs(probs[first] - 2 / 3) < 1e-12
+    assert abs(probs[second] - 1 / 3) < 1e-12
+    assert abs(sum(probs.values()) - 1.0) < 1e-12
+
+
+def test_pool_requires_cxx(monkeypatch):
+    monkeypatch.setattr(cxx, "HAS_CXX", False)
+    with pytest.raises(RuntimeError):
+        SimulationPool(strength_df["team"], strength_df["strength"], processes=1)
+
+
+@pytest.mark.skipif(not HAS_CXX, reason="C++ backend not built")
+def test_pool_serves_repeated_requests():
+    with SimulationPool(strength_df["team"], strength_df["strength"], processes=2) as pool:
+        first  = pool.simulate(n_runs=10, seed=1)
+        again  = pool.simulate(n_runs=10, seed=1)
+        frame  = pool.simulate_df(n_runs=10, seed=2)
+    assert first == again
+    assert abs(sum(first.values()) - 1.0) < 1e-9
+    assert abs(frame["champion_prob"].sum() - 1.0) < 1e-9
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+
+from src.core.match_model import match_probabilities
+from src.core.pricing import correct_score_table, edge_table, price_fixtures
+from src.core.strength import calc_team_strength
+
+strength_df = calc_team_strength(
+    pd.DataFrame({"team": ["A", "B", "C", "D"], "implied_prob": [0.4, 0.3, 0.2, 0.1]})
+)
+
+
+def test_1x2_matches_single_match_model():
+    prices = price_fixtures(strength_df)
+    assert len(prices) == 4 * 3
+    s = strength_df.set_index("team")["strength"]
+    for row in prices.itertuples():
+        ref = match_probabilities(s[row.home_team], s[row.away_team])
+        assert abs(row.home - ref["home"]) < 1e-12
+        assert abs(row.draw - ref["draw"]) < 1e-12
+        assert abs(row.away - ref["away"]) < 1e-12
+
+
+def test_markets_are_complementary():
+    prices = price_fixtures(strength_df, [("A", "D"), ("C", "B")], lines=(1.5, 2.5))
+    assert np.allclose(prices[["home", "draw", "away"]].sum(axis=1), 1.0)
+    assert np.allclose(prices["over_2.5"] + prices["under_2.5"], 1.0)
+    assert (prices["over_1.5"] > prices["over_2.5"]).all()
+    assert ((prices["btts_yes"] > 0) & (prices["btts_yes"] < 1)).all()
+
+
+def test_correct_score_grid_sums_to_one():
+    cs = correct_score_table(strength_df, [("A", "B")], max_goals=6)
+    assert len(cs) == 7 * 7
+    assert abs(cs["prob"].sum() - 1.0) < 1e-12
+
+
+def test_edge_table():
+    h2h = pd.DataFrame(
+        {
+            "match_id": ["m1", "m2"],
+            "bookmaker": ["X", "X"],
+            "home_team": ["A", "B"],
+            "away_team": ["D", "Unknown"],
+            "home_odds": [1.5, 2.0],
+            "away_odds": [6.0, 3.5],
+            "draw_odds": [4.0, 3.2],
+        }
+    )
+    edges = edge_table(strength_df, h2h)
+    assert set(edges["match_id"]) == {"m1"}
+    assert len(edges) == 3
+    assert edges["edge"].is_monotonic_decreasing
+    assert abs(edges["market_prob"].sum() - 1.0) < 1e-9
+
+
+def test_whole_number_line_excludes_push():
+    prices = price_fixtures(strength_df, [("A", "B")], lines=(3,))
+    cs = correct_score_table(strength_df, [("A", "B")])
+    total = cs["home_goals"] + cs["away_goals"]
+    assert abs(prices.loc[0, "under_3"] - cs.loc[total < 3, "prob"].sum()) < 1e-12
+    assert abs(prices.loc[0, "over_3"] - cs.loc[total > 3, "prob"].sum()) < 1e-12
+    push = cs.loc[total == 3, "prob"].sum()
+    assert abs(prices.loc[0, "over_3"] + prices.loc[0, "under_3"] + push - 1.0) < 1e-12
+
+
+def test_edge_table_two_way_book():
+    h2h = pd.DataFrame(
+        {
+            "match_id": ["m1"],
+            "bookmaker": ["X"],
+            "home_team": ["A"],
+            "away_team": ["B"],
+            "home_odds": [1.9],
+            "away_odds": [1.9],
+            "draw_odds": [None],
+        }
+    )
+    edges = edge_table(strength_df, h2h)
+    assert set(edges["outcome"]) == {"home", "away"}
+    assert abs(edges["model_prob"].sum() - 1.0) < 1e-12
+    assert abs(edges["market_prob"].sum() - 1.0) < 1e-12
+
+
+def test_edge_table_empty_refresh():
+    empty = edge_table(strength_df, pd.DataFrame([]))
+    assert empty.empty and "edge" in empty.columns
+
+    no_draw_col = pd.DataFrame(
+        {
+            "match_id": ["m1"],
+            "bookmaker": ["X"],
+            "home_team": ["A"],
+            "away_team": ["B"],
+            "home_odds": [1.9],
+            "away_odds": [1.9],
+        }
+    )
+    edges = edge_table(strength_df, no_draw_col)
+    assert set(edges["outcome"]) == {"home", "away"}
+    assert abs(edges["model_prob"].sum() - 1.0) < 1e-12
@@ -0,0 +1,29 @@
+import json, pathlib, subprocess, sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+IMPORT_BUDGET_S = 0.25          # wall-clock for `import src.core._cxx` in a fresh interpreter
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import src.core._cxx, src.core.pool
+dt = time.perf_counter() - t0
+print(json.dumps({"dt": dt,
+                  "heavy": [m for m in ("pandas", "scipy", "src.core.tournament")
+                            if m in sys.modules]}))
+"""
+
+
+def _probe() -> dict:
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT,
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def test_core_import_is_lightweight():
+    assert _probe()["heavy"] == []
+
+
+def test_core_import_time_budget():
+    dt = min(_probe()["dt"] for _ in range(3))
+    assert dt < IMPORT_BUDGET_S, f"core import too slow ({dt:.3f}s)"
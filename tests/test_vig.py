@@ -1,6 +1,6 @@
 import pandas as pd
 
-from src.core.vig import decimal_to_prob, strip_vig_h2h, strip_vig_outrights
+from src.core.vig import decimal_to_prob, strip_vig_h2h, strip_vig_h2h_df, strip_vig_outrights
 
 
 def test_decimal_to_prob():
@@ -24,3 +24,25 @@ def test_strip_vig_outrights():
     )
     out = strip_vig_outrights(df)
     assert abs(out["implied_prob"].sum() - 1.0) < 1e-9
+
+
+def test_strip_vig_h2h_df_matches_rowwise():
+    df = pd.DataFrame(
+        {
+            "home_odds": [1.8, 2.5],
+            "away_odds": [4.2, 2.9],
+            "draw_odds": [3.8, None],
+        }
+    )
+    out = strip_vig_h2h_df(df)
+    for i in range(len(df)):
+        row = strip_vig_h2h(df.iloc[i].copy())
+        for c in ("home_prob", "away_prob"):
+            assert abs(out.loc[i, c] - row[c]) < 1e-12
+    assert abs(out.loc[0, ["home_prob", "away_prob", "draw_prob"]].sum() - 1.0) < 1e-9
+
+
+def test_strip_vig_h2h_df_empty():
+    # OddsAPIClient.to_dataframe([]) when no events are listed
+    out = strip_vig_h2h_df(pd.DataFrame([]))
+    assert out.empty